@@ -1,13 +1,26 @@
-import erdantic
-from rich.pretty import pprint
+from pathlib import Path
 
 from overture_schema_pydantic.divisions import Division
 
+OUT_DIR = Path(__file__).parent / "../../../out"
 
-diagram = erdantic.create(Division)
-pprint(diagram)
 
-with open("../../../out/division.gv", "w") as file:
-    file.write(diagram.to_dot())
+def main():
+    # erdantic pulls in pygraphviz, so only import it when actually drawing diagrams.
+    import erdantic
+    from rich.pretty import pprint
 
-diagram.draw("../../../out/division.png", format="png")
+    diagram = erdantic.create(Division)
+    pprint(diagram)
+
+    out_dir = OUT_DIR.resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(out_dir / "division.gv", "w") as file:
+        file.write(diagram.to_dot())
+
+    diagram.draw(out_dir / "division.png", format="png")
+
+
+if __name__ == "__main__":
+    main()
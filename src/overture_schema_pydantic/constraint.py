@@ -2,14 +2,8 @@ from abc import ABC, abstractmethod
 from collections.abc import Collection
 from typing import get_origin, Any
 
-from pydantic import (
-    BaseModel,
-    GetCoreSchemaHandler,
-    GetJsonSchemaHandler,
-    ValidationError,
-    ValidationInfo,
-)
-from pydantic_core import core_schema, InitErrorDetails
+from pydantic import BaseModel, GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic_core import core_schema, PydanticCustomError
 
 
 class CollectionConstraint(ABC):
@@ -47,30 +41,21 @@ class MinItems(CollectionConstraint):
     def min_items(self) -> int:
         return self.__min_items
 
-    def validate(self, value: Any, info: ValidationInfo):
+    def validate(self, value: Any) -> Any:
         num_items = len(value)
         if num_items < self.min_items:
-            context = info.context or {}
-            loc = context.get("loc_prefix", ()) + ("value",)
-            raise ValidationError.from_exception_data(
-                title=self.__class__.__name__,
-                line_errors=[
-                    InitErrorDetails(
-                        type="value_error",
-                        loc=loc,
-                        input=value,
-                        ctx={
-                            "error": f"collection has too few items: expected len>={self.min_items} but got len={num_items})"
-                        },
-                    )
-                ],
+            raise PydanticCustomError(
+                "too_few_items",
+                "collection has too few items: expected len>={min_items} but got len={num_items}",
+                {"min_items": self.min_items, "num_items": num_items},
             )
+        return value
 
     def __get_pydantic_core_schema__(
         self, source: type[Any], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         schema = super().__get_pydantic_core_schema__(source, handler)
-        return core_schema.with_info_after_validator_function(self.validate, schema)
+        return core_schema.no_info_after_validator_function(self.validate, schema)
 
     def __get_pydantic_json_schema__(
         self, core_schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
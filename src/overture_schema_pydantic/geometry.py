@@ -1,73 +1,154 @@
-from typing import Any, Optional
-
-from pydantic import (
-    GetCoreSchemaHandler,
-    GetJsonSchemaHandler,
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+import pydantic_core
+from pydantic_core import (
+    core_schema,
+    InitErrorDetails,
+    PydanticCustomError,
     ValidationError,
-    ValidationInfo,
 )
-from pydantic_core import core_schema, InitErrorDetails
 
-from shapely.geometry import shape, mapping
+import shapely
+from shapely.geometry import (
+    LineString,
+    MultiLineString,
+    MultiPoint,
+    MultiPolygon,
+    Point,
+    Polygon,
+    mapping,
+    shape,
+)
 from shapely.geometry.base import BaseGeometry
 
-# Note: It would be better to model this as a string enumeration class GeometryType(Enum, str)
-#       and then you get GeometryType(str) with a ValueError on unrecognized type as a freebie.
-_GEOMETRY_TYPES = (
-    "GeometryCollection",
-    "LineString",
-    "Point",
-    "Polygon",
-    "MultiLineString",
-    "MultiPoint",
-    "MultiPolygon",
-)
+
+class GeometryType(StrEnum):
+    GEOMETRY_COLLECTION = "GeometryCollection"
+    LINE_STRING = "LineString"
+    POINT = "Point"
+    POLYGON = "Polygon"
+    MULTI_LINE_STRING = "MultiLineString"
+    MULTI_POINT = "MultiPoint"
+    MULTI_POLYGON = "MultiPolygon"
+
+
+_GEOMETRY_TYPES = tuple(t.value for t in GeometryType)
+
+_GEOMETRY_TYPES_SET = frozenset(_GEOMETRY_TYPES)
+
+# Direct shapely constructors for each GeoJSON geometry type, mirroring `shapely.geometry.shape`
+# without repeating its type dispatch or its recursive scan for empty coordinates. They only
+# match `shape` for non-empty geometries; see `_shapely_from_geo_json`.
+_GEO_JSON_CONSTRUCTORS: dict[str, Callable[[dict[str, Any]], BaseGeometry]] = {
+    "GeometryCollection": shape,
+    "LineString": lambda v: LineString(v["coordinates"]),
+    "Point": lambda v: Point(v["coordinates"]),
+    "Polygon": lambda v: Polygon(v["coordinates"][0], v["coordinates"][1:]),
+    "MultiLineString": lambda v: MultiLineString(v["coordinates"]),
+    "MultiPoint": lambda v: MultiPoint(v["coordinates"]),
+    "MultiPolygon": lambda v: MultiPolygon([[c[0], c[1:]] for c in v["coordinates"]]),
+}
+
+
+def _shapely_from_geo_json(
+    value: dict[str, Any],
+    _shape=shape,
+    _constructors=_GEO_JSON_CONSTRUCTORS,
+) -> BaseGeometry:
+    # The caller has already checked that `value` is a dict with a valid geometry `type`.
+    # This runs once per validated geometry, so globals are bound as defaults (fast locals).
+    try:
+        geom = _constructors[value["type"]](value)
+    except Exception:
+        geom = None
+    if geom is None or geom.is_empty:
+        # `shape` has its own handling of missing and (nested) empty coordinates, and raises its
+        # own errors. A non-empty result from the direct constructor is exactly what `shape`
+        # would have built, so only the remaining cases need it.
+        return _shape(value)
+    return geom
 
 
 class GeometryTypeConstraint:
-    def __init__(self, *allowed_types: str):
-        self.__allowed_types = self.__class__._validate_geometry_types(allowed_types)
+    __slots__ = ("__allowed_types", "__allowed_set", "__json_schema")
+
+    # Constraints are immutable, so instances are interned by their canonical allowed types.
+    # Every `Annotated[Geometry, GeometryTypeConstraint(...)]` with the same allowed types
+    # thus shares one instance, one bound validator, and one JSON Schema.
+    __instance_cache: dict[
+        tuple[type["GeometryTypeConstraint"], tuple[str, ...]], "GeometryTypeConstraint"
+    ] = {}
+
+    def __new__(cls, *allowed_types: GeometryType | str) -> "GeometryTypeConstraint":
+        allowed_types = cls._validate_geometry_types(allowed_types)
+        key = (cls, allowed_types)
+        instance = GeometryTypeConstraint.__instance_cache.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.__allowed_types = allowed_types
+            # The tuple keeps the canonical order (JSON Schema, error messages); the set is for
+            # O(1) membership tests in `validate`.
+            instance.__allowed_set = frozenset(allowed_types)
+            instance.__json_schema = _json_schema_for(allowed_types)
+            GeometryTypeConstraint.__instance_cache[key] = instance
+        return instance
+
+    def __reduce__(self):
+        # Copying and unpickling must go through `__new__` with the allowed types, which also
+        # makes them return the interned instance.
+        return (type(self), self.__allowed_types)
 
     @property
     def allowed_types(self) -> tuple[str, ...]:
         return self.__allowed_types
 
-    def validate(self, value: "Geometry", info: ValidationInfo):
+    def validate(self, value: "Geometry") -> "Geometry":
         geometry_type = value.geom.geom_type
-        if geometry_type not in self.allowed_types:
-            context = info.context or {}
-            loc = context.get("loc_prefix", ()) + ("value",)
-            raise ValidationError.from_exception_data(
-                title=self.__class__.__name__,
-                line_errors=[
-                    InitErrorDetails(
-                        type="value_error",
-                        loc=loc,
-                        input=value,
-                        ctx={
-                            "error": f"geometry type not allowed: {repr(geometry_type)} (allowed values: {repr(self.allowed_types)})"
-                        },
-                    )
-                ],
+        if geometry_type not in self.__allowed_set:
+            raise PydanticCustomError(
+                "geometry_type_not_allowed",
+                "geometry type not allowed: {geometry_type} (allowed values: {allowed_types})",
+                {"geometry_type": geometry_type, "allowed_types": self.__allowed_types},
             )
+        return value
 
     @classmethod
-    def _validate_geometry_types(cls, a: list[str]) -> tuple[str]:
+    def _validate_geometry_types(
+        cls, a: tuple[GeometryType | str, ...]
+    ) -> tuple[str, ...]:
         if not a:
             raise ValueError(
                 f"allowed_types is empty (it must contain at least one of: {_GEOMETRY_TYPES})"
             )
 
-        if not all(item in _GEOMETRY_TYPES for item in a):
-            invalid = [item for item in a if item not in _GEOMETRY_TYPES]
+        # Fast path for allowed types that are already canonical, i.e. sorted, unique, valid plain
+        # strings, which is how they are usually written, e.g. `("LineString", "MultiLineString")`.
+        if all(type(x) is str and x in _GEOMETRY_TYPES_SET for x in a) and all(
+            a[i] < a[i + 1] for i in range(len(a) - 1)
+        ):
+            return tuple(a)
+
+        # Check the types first so unhashable values are reported as invalid, not as a TypeError.
+        invalid = [
+            item
+            for item in a
+            if not isinstance(item, str) or item not in _GEOMETRY_TYPES_SET
+        ]
+        if invalid:
             raise ValueError(
                 f"allowed_types contains invalid values: {invalid} (allowed: {_GEOMETRY_TYPES})"
             )
 
-        if len(set(a)) != len(a):
+        a_set = set(a)
+
+        if len(a_set) != len(a):
             raise ValueError(f"allowed_types contains duplicate(s)")
 
-        return tuple(sorted(a))
+        # Canonicalize through the enum so `GeometryType` members become plain strings.
+        return tuple(sorted(GeometryType(item).value for item in a_set))
 
     def __get_pydantic_core_schema__(
         self, source: type[Any], handler: GetCoreSchemaHandler
@@ -77,33 +158,73 @@ class GeometryTypeConstraint:
                 f"{GeometryTypeConstraint.__name__} can only be applied to {Geometry.__name__}; but it was applied to {source.__name__}"
             )
         schema = handler(source)
-        return core_schema.with_info_after_validator_function(self.validate, schema)
+        return core_schema.no_info_after_validator_function(self.validate, schema)
 
     def __get_pydantic_json_schema__(
         self, source: type[Any], handler: GetJsonSchemaHandler
     ) -> dict[str, Any]:
-        if len(self.allowed_types) == 1:
-            return _GEOMETRY_JSON_SCHEMA[self.allowed_types[0]]
-        else:
-            allowed_schemas = tuple(
-                map(
-                    lambda x: _GEOMETRY_JSON_SCHEMA[x],
-                    self.allowed_types,
-                )
-            )
-            return {
-                "oneOf": allowed_schemas,
+        return self.__json_schema
+
+
+def _geo_json_core_schema() -> core_schema.CoreSchema:
+    """
+    Builds a pydantic-core schema that validates the structure of a GeoJSON geometry.
+
+    The geometry `type` is the discriminator of a tagged union, so pydantic-core rejects unknown
+    types and missing members without calling into Python. Coordinates are passed through
+    as-is: shapely validates them when it builds the geometry, and validating them here as well
+    would copy every vertex. A new schema is built on each call because pydantic may modify the
+    schemas it is given.
+    """
+
+    def geometry(geometry_type: str, member: str) -> core_schema.CoreSchema:
+        return core_schema.typed_dict_schema(
+            {
+                "type": core_schema.typed_dict_field(
+                    core_schema.literal_schema([geometry_type])
+                ),
+                "bbox": core_schema.typed_dict_field(
+                    # Matches `_BBOX_JSON_SCHEMA`.
+                    core_schema.list_schema(
+                        core_schema.float_schema(strict=True), min_length=4
+                    ),
+                    required=False,
+                ),
+                member: core_schema.typed_dict_field(core_schema.any_schema()),
             }
+        )
 
-
-_ALL_GEOMETRY_ALLOWED = GeometryTypeConstraint(*_GEOMETRY_TYPES)
+    return core_schema.tagged_union_schema(
+        {
+            geometry_type: geometry(
+                geometry_type,
+                (
+                    "geometries"
+                    if geometry_type == "GeometryCollection"
+                    else "coordinates"
+                ),
+            )
+            for geometry_type in _GEOMETRY_TYPES
+        },
+        discriminator="type",
+    )
 
 
 class Geometry:
-    geom: BaseGeometry
+    __slots__ = ("__geom", "__geo_json")
 
     def __init__(self, geom: BaseGeometry):
-        self.geom = geom
+        self.__geom = geom
+        self.__geo_json = None
+
+    @property
+    def geom(self) -> BaseGeometry:
+        return self.__geom
+
+    @geom.setter
+    def geom(self, geom: BaseGeometry):
+        self.__geom = geom
+        self.__geo_json = None
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Geometry) and self.geom == other.geom
@@ -118,10 +239,47 @@ class Geometry:
         return self.wkt
 
     def to_geo_json(self) -> dict[str, Any]:
-        return mapping(self.geom)
+        """
+        Returns the GeoJSON mapping of the geometry.
+
+        The mapping is built once and the same object is returned on every call until `geom` is
+        reassigned. It must not be mutated; copy it first if a modified version is needed.
+        """
+        if self.__geo_json is None:
+            self.__geo_json = mapping(self.__geom)
+        return self.__geo_json
 
     @classmethod
     def from_geo_json(cls, value: Any) -> "Geometry":
+        cls._check_geo_json_type(value)
+
+        return cls(_shapely_from_geo_json(value))
+
+    @classmethod
+    def from_geo_json_str(cls, value: str | bytes) -> "Geometry":
+        """
+        Parses a GeoJSON geometry from a JSON string.
+
+        The geometry is built natively by GEOS, avoiding `json.loads` and the per-vertex Python
+        work of `from_geo_json`. It accepts the same inputs as `from_geo_json`: GEOS would also
+        resolve `Feature` and `FeatureCollection` documents to their geometries, so the document
+        is first parsed by pydantic-core's (native) JSON parser to check its top-level `type`.
+
+        This is not used when validating models from JSON: pydantic-core parses the whole
+        document before any Python validator runs, so there is no string left to hand to GEOS.
+        """
+        cls._check_geo_json_type(pydantic_core.from_json(value))
+
+        geom = shapely.from_geojson(value)
+        if geom.geom_type not in _GEOMETRY_TYPES_SET:
+            raise ValueError(
+                f"unsupported geometry type {repr(geom.geom_type)} (allowed: {_GEOMETRY_TYPES})"
+            )
+
+        return cls(geom)
+
+    @staticmethod
+    def _check_geo_json_type(value: Any):
         if not isinstance(value, dict):
             raise TypeError(
                 f"value must be a dict; but {repr(value)} has type {type(value).__name__}"
@@ -129,39 +287,37 @@ class Geometry:
 
         type_ = value.get("type")
 
-        if type_ not in _GEOMETRY_TYPES:
+        if type_ not in _GEOMETRY_TYPES_SET:
             raise ValueError(
                 f"allowed_types contains invalid value {repr(type_)} (allowed: {_GEOMETRY_TYPES})"
             )
 
-        return cls(shape(value))
-
     @classmethod
     def __get_pydantic_core_schema__(
         cls, _source_type: Any, _handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        def validator(value: Any, info: ValidationInfo) -> Geometry:
+        # The GeoJSON structure is validated by pydantic-core, so only the shapely conversion
+        # runs in Python.
+        def validator(
+            value: dict[str, Any],
+            _cls=cls,
+            _shapely_from_geo_json=_shapely_from_geo_json,
+            _error=PydanticCustomError,
+        ) -> Geometry:
             try:
-                return cls.from_geo_json(value)
+                return _cls(_shapely_from_geo_json(value))
             except Exception as e:
-                context = info.context or {}
-                loc = context.get("loc_prefix", ()) + ("value",)
-                raise ValidationError.from_exception_data(
-                    title=cls.__name__,
-                    line_errors=[
-                        InitErrorDetails(
-                            type="value_error",
-                            loc=loc,
-                            input=value,
-                            ctx={"error": f"invalid geometry value: {str(e)}"},
-                        )
-                    ],
+                raise _error(
+                    "invalid_geometry",
+                    "invalid geometry value: {error}",
+                    {"error": str(e)},
                 )
 
-        return core_schema.with_info_plain_validator_function(
+        return core_schema.no_info_after_validator_function(
             validator,
+            _geo_json_core_schema(),
             serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda v: v.to_geojson()
+                lambda v: v.to_geo_json()
             ),
         )
 
@@ -172,24 +328,87 @@ class Geometry:
         return _ALL_GEOMETRY_ALLOWED.__get_pydantic_json_schema__(core_schema, handler)
 
 
+class GeometryList(list[Geometry]):
+    """
+    A list of geometries validated in one pass.
+
+    Unlike `list[Geometry]`, which dispatches to the `Geometry` validator once per item, the
+    whole list is validated by pydantic-core and then converted by a single validator call.
+    For bulk conversion, create one `TypeAdapter(GeometryList)` at module scope and reuse it.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, _source_type: Any, _handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        def validator(value: list[dict[str, Any]]) -> GeometryList:
+            geometry = Geometry
+            shapely_from_geo_json = _shapely_from_geo_json
+            geometries = cls()
+            append = geometries.append
+            errors = []
+            for index, item in enumerate(value):
+                try:
+                    append(geometry(shapely_from_geo_json(item)))
+                except Exception as e:
+                    # Report each bad item at its own location, like `list[Geometry]` does.
+                    errors.append(
+                        InitErrorDetails(
+                            type=PydanticCustomError(
+                                "invalid_geometry",
+                                "invalid geometry value: {error}",
+                                {"error": str(e)},
+                            ),
+                            loc=(index,),
+                            input=item,
+                        )
+                    )
+            if errors:
+                raise ValidationError.from_exception_data(cls.__name__, errors)
+            return geometries
+
+        return core_schema.no_info_after_validator_function(
+            validator,
+            core_schema.list_schema(_geo_json_core_schema()),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda v: [g.to_geo_json() for g in v]
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, core_schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict[str, Any]:
+        return {
+            "type": "array",
+            "items": _ALL_GEOMETRY_ALLOWED.__get_pydantic_json_schema__(
+                core_schema, handler
+            ),
+        }
+
+
 ########################################################################
 # JSON Schema primitives for GeoJSON geometry
 ########################################################################
 
+# These fragments are shared by reference (never copied) throughout the geometry JSON Schemas.
+# Pydantic returns them by reference too, so they must not be mutated. They are kept as plain
+# dicts because read-only mappings are not JSON serializable.
+
+_NUMBER_JSON_SCHEMA = {
+    "type": "number",
+}
+
 _BBOX_JSON_SCHEMA = {
     "type": "array",
     "minItems": 4,
-    "items": {
-        "type": "number",
-    },
+    "items": _NUMBER_JSON_SCHEMA,
 }
 
 _POINT_COORDINATES_JSON_SCHEMA = {
     "type": "array",
     "minItems": 2,
-    "items": {
-        "type": "number",
-    },
+    "items": _NUMBER_JSON_SCHEMA,
 }
 
 ########################################################################
@@ -305,12 +524,26 @@ _GEOMETRY_COLLECTION_JSON_SCHEMA = geometry_json_schema(
 # Lookup table for all the JSON Schema
 ########################################################################
 
-_GEOMETRY_JSON_SCHEMA = {
-    "GeometryCollection": _GEOMETRY_COLLECTION_JSON_SCHEMA,
-    "LineString": _LINE_STRING_GEOMETRY_JSON_SCHEMA,
-    "Point": _POINT_GEOMETRY_JSON_SCHEMA,
-    "Polygon": _POLYGON_GEOMETRY_JSON_SCHEMA,
-    "MultiLineString": _MULTI_LINE_STRING_GEOMETRY_JSON_SCHEMA,
-    "MultiPoint": _MULTI_POINT_GEOMETRY_JSON_SCHEMA,
-    "MultiPolygon": _MULTI_POLYGON_GEOMETRY_JSON_SCHEMA,
-}
+_GEOMETRY_JSON_SCHEMA = MappingProxyType(
+    {
+        "GeometryCollection": _GEOMETRY_COLLECTION_JSON_SCHEMA,
+        "LineString": _LINE_STRING_GEOMETRY_JSON_SCHEMA,
+        "Point": _POINT_GEOMETRY_JSON_SCHEMA,
+        "Polygon": _POLYGON_GEOMETRY_JSON_SCHEMA,
+        "MultiLineString": _MULTI_LINE_STRING_GEOMETRY_JSON_SCHEMA,
+        "MultiPoint": _MULTI_POINT_GEOMETRY_JSON_SCHEMA,
+        "MultiPolygon": _MULTI_POLYGON_GEOMETRY_JSON_SCHEMA,
+    }
+)
+
+
+def _json_schema_for(allowed_types: tuple[str, ...]) -> dict[str, Any]:
+    if len(allowed_types) == 1:
+        return _GEOMETRY_JSON_SCHEMA[allowed_types[0]]
+    else:
+        return {
+            "oneOf": tuple(_GEOMETRY_JSON_SCHEMA[t] for t in allowed_types),
+        }
+
+
+_ALL_GEOMETRY_ALLOWED = GeometryTypeConstraint(*_GEOMETRY_TYPES)
@@ -1,11 +1,24 @@
-from overture_schema_pydantic.geometry import Geometry, GeometryTypeConstraint
+from overture_schema_pydantic.geometry import (
+    Geometry,
+    GeometryList,
+    GeometryType,
+    GeometryTypeConstraint,
+    _BBOX_JSON_SCHEMA,
+    _GEOMETRY_JSON_SCHEMA,
+    _POINT_COORDINATES_JSON_SCHEMA,
+)
 
+import copy
+import json
+import pickle
 from dataclasses import dataclass
 from itertools import chain, combinations
 from typing import Annotated
 
+import numpy as np
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from shapely.geometry import shape
 
 
 def test_geometry_type_constraint_empty():
@@ -22,6 +35,192 @@ def test_geometry_type_constraint_invalid():
             geometry: Annotated[Geometry, GeometryTypeConstraint("foo")]
 
 
+@pytest.mark.parametrize("allowed_types", ((1, "foo"), (["Point"],), (None,)))
+def test_geometry_type_constraint_invalid_non_str(allowed_types):
+    with pytest.raises(ValueError):
+        GeometryTypeConstraint(*allowed_types)
+
+
+def test_geometry_type_constraint_interned():
+    assert GeometryTypeConstraint("Point", "Polygon") is GeometryTypeConstraint(
+        "Polygon", "Point"
+    )
+    assert GeometryTypeConstraint("Point") is not GeometryTypeConstraint("Polygon")
+    assert GeometryTypeConstraint(GeometryType.POINT) is GeometryTypeConstraint("Point")
+    assert type(GeometryTypeConstraint(GeometryType.POINT).allowed_types[0]) is str
+
+
+def test_geometry_type_constraint_not_allowed():
+    class PointModel(BaseModel):
+        geometry: Annotated[Geometry, GeometryTypeConstraint("Point")]
+
+    with pytest.raises(ValidationError) as exc_info:
+        PointModel(geometry={"type": "LineString", "coordinates": [[0, 0], [1, 1]]})
+
+    (error,) = exc_info.value.errors()
+    assert error["type"] == "geometry_type_not_allowed"
+    assert error["loc"] == ("geometry",)
+
+
+def test_geometry_serialization():
+    class GeometryModel(BaseModel):
+        geometry: Geometry
+
+    model_instance = GeometryModel(geometry={"type": "Point", "coordinates": [1, 2]})
+
+    assert model_instance.model_dump() == {
+        "geometry": {"type": "Point", "coordinates": (1.0, 2.0)}
+    }
+    assert model_instance.model_dump_json() == (
+        '{"geometry":{"type":"Point","coordinates":[1.0,2.0]}}'
+    )
+    assert (
+        model_instance.geometry.to_geo_json() is model_instance.geometry.to_geo_json()
+    )
+
+    model_instance.geometry.geom = shape({"type": "Point", "coordinates": [5, 5]})
+    assert model_instance.geometry.to_geo_json() == {
+        "type": "Point",
+        "coordinates": (5.0, 5.0),
+    }
+
+
+def test_geometry_list():
+    adapter = TypeAdapter(GeometryList)
+
+    geometries = adapter.validate_python(
+        [
+            {"type": "Point", "coordinates": [0, 0]},
+            {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+        ]
+    )
+
+    assert isinstance(geometries, GeometryList)
+    assert [g.geom.geom_type for g in geometries] == ["Point", "LineString"]
+    assert adapter.dump_python(geometries) == [g.to_geo_json() for g in geometries]
+
+    with pytest.raises(ValidationError) as exc_info:
+        adapter.validate_python(
+            [{"type": "Point", "coordinates": [0, 0]}, {"type": "Point"}]
+        )
+
+    (error,) = exc_info.value.errors()
+    assert error["type"] == "missing"
+    assert error["loc"] == (1, "Point", "coordinates")
+
+    class GeometryListModel(BaseModel):
+        geometries: GeometryList
+
+    bad_item = {"type": "Point", "coordinates": "bad"}
+    with pytest.raises(ValidationError) as exc_info:
+        GeometryListModel(
+            geometries=[{"type": "Point", "coordinates": [0, 0]}, bad_item, bad_item]
+        )
+
+    errors = exc_info.value.errors()
+    assert [error["type"] for error in errors] == ["invalid_geometry"] * 2
+    assert [error["loc"] for error in errors] == [("geometries", 1), ("geometries", 2)]
+    assert errors[0]["input"] == bad_item
+
+
+def test_geometry_error_loc_nested():
+    class PointModel(BaseModel):
+        geometry: Annotated[Geometry, GeometryTypeConstraint("Point")]
+
+    class ContainerModel(BaseModel):
+        items: list[PointModel]
+
+    with pytest.raises(ValidationError) as exc_info:
+        ContainerModel(
+            items=[
+                {"geometry": {"type": "Point", "coordinates": [0, 0]}},
+                {"geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}},
+            ]
+        )
+
+    (error,) = exc_info.value.errors()
+    assert error["type"] == "geometry_type_not_allowed"
+    assert error["loc"] == ("items", 1, "geometry")
+
+
+def test_geometry_json_schema_shared():
+    for geometry_json_schema in _GEOMETRY_JSON_SCHEMA.values():
+        assert geometry_json_schema["properties"]["bbox"] is _BBOX_JSON_SCHEMA
+    assert (
+        _GEOMETRY_JSON_SCHEMA["Point"]["properties"]["coordinates"]
+        is _POINT_COORDINATES_JSON_SCHEMA
+    )
+
+    class GeometryModel(BaseModel):
+        geometry: Geometry
+        point: Annotated[Geometry, GeometryTypeConstraint("Point")]
+
+    json.dumps(GeometryModel.model_json_schema())
+
+
+def test_geometry_from_geo_json_str():
+    value = {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}
+
+    assert Geometry.from_geo_json_str(json.dumps(value)) == Geometry.from_geo_json(
+        value
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0, 0]}},
+        {"type": "FeatureCollection", "features": []},
+        [{"type": "Point", "coordinates": [0, 0]}],
+    ),
+)
+def test_geometry_from_geo_json_str_rejects_non_geometry(value):
+    with pytest.raises((TypeError, ValueError)):
+        Geometry.from_geo_json(value)
+    with pytest.raises((TypeError, ValueError)):
+        Geometry.from_geo_json_str(json.dumps(value))
+
+
+def test_geometry_type_constraint_copy_and_pickle():
+    constraint = GeometryTypeConstraint("Point", "Polygon")
+
+    assert copy.copy(constraint) is constraint
+    assert copy.deepcopy(constraint) is constraint
+    assert pickle.loads(pickle.dumps(constraint)) is constraint
+
+    class ConstrainedModel(BaseModel):
+        geometry: Annotated[Geometry, constraint]
+
+    copy.deepcopy(ConstrainedModel.model_fields)
+
+
+EDGE_CASE_GEO_JSON = (
+    {"type": "Point", "coordinates": np.array([1.0, 2.0])},
+    {"type": "LineString", "coordinates": np.array([[0.0, 0.0], [1.0, 1.0]])},
+    *(
+        {"type": geometry_type, "coordinates": coordinates}
+        for geometry_type in (
+            "Point",
+            "LineString",
+            "Polygon",
+            "MultiPoint",
+            "MultiLineString",
+            "MultiPolygon",
+        )
+        for coordinates in ([], [[]], [[[]]], [[[[]]]])
+    ),
+    {"type": "GeometryCollection", "geometries": []},
+)
+
+
+@pytest.mark.parametrize("value", EDGE_CASE_GEO_JSON)
+def test_geometry_from_geo_json_matches_shape(value):
+    expected = shape(value)
+
+    assert Geometry.from_geo_json(value).geom.wkt == expected.wkt
+    assert TypeAdapter(Geometry).validate_python(value).geom.wkt == expected.wkt
+
+
 @dataclass
 class GeometryTypeCase:
     geometry_type: str
@@ -35,6 +234,7 @@ TEST_GEOMETRY_TYPE_CASES: tuple[GeometryTypeCase] = (
         examples=(
             {"type": "Point", "coordinates": [0, 0]},
             {"type": "Point", "coordinates": [-90, 131.5]},
+            {"type": "Point", "coordinates": [1, 2], "bbox": [1, 2, 1, 2]},
         ),
         counterexamples=(
             {},
@@ -43,6 +243,9 @@ TEST_GEOMETRY_TYPE_CASES: tuple[GeometryTypeCase] = (
             {"type": "Point", "coordinates": "foo"},
             {"type": "Point", "coordinates": [0]},
             {"type": "Point", "coordinates": [[0, 0], [1, 1]]},
+            {"type": "Point", "coordinates": [1, 2], "bbox": None},
+            {"type": "Point", "coordinates": [1, 2], "bbox": [1]},
+            {"type": "Point", "coordinates": [1, 2], "bbox": ["a", "b", "c", "d"]},
         ),
     ),
 )
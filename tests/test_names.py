@@ -0,0 +1,18 @@
+from overture_schema_pydantic.names import Names
+
+import pytest
+from pydantic import ValidationError
+
+
+def test_common_valid():
+    m = Names(primary="foo", common={"en": "bar"})
+    assert m.common == {"en": "bar"}
+
+
+def test_common_empty():
+    with pytest.raises(ValidationError) as exc_info:
+        Names(primary="foo", common={})
+
+    (error,) = exc_info.value.errors()
+    assert error["type"] == "too_few_items"
+    assert error["loc"] == ("common",)